@@ -2,23 +2,118 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import difflib
+import hashlib
 import logging
 import pathlib
 
 import voluptuous as vol
 
+from homeassistant.components.sensor import ATTR_STATE_CLASS
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DEVICE_ID, CONF_FILE_PATH, CONF_PLATFORM, Platform
-from homeassistant.core import HomeAssistant, HomeAssistantError, ServiceCall
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_LABEL_ID,
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_FILE_PATH,
+    CONF_PLATFORM,
+    Platform,
+)
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    HomeAssistantError,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
-
-from .const import DOMAIN
-from .page_config import Page, PageTypes, WidgetTypes, dict_to_yaml_str
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .const import (
+    ATTR_DEBOUNCE,
+    ATTR_DELTA,
+    ATTR_MAX_VALUE,
+    ATTR_MIN_VALUE,
+    ATTR_SENSOR_WIDGET,
+    ATTR_SENSORS,
+    ATTR_THROTTLE,
+    BUDGET_ACTION_REFUSE,
+    CONF_BUDGET_ACTION,
+    CONF_CONFIG_ENTRY_ID,
+    CONF_DISPLAY_PROFILES,
+    CONF_MAX_FONT_KB,
+    CONF_MAX_HEAP_KB,
+    CONF_MAX_OBJECTS,
+    DATA_ENTITY_INDEX,
+    DATA_ENTITY_LISTENER,
+    DEFAULT_SENSOR_THROTTLE,
+    DOMAIN,
+    EVENT_CONFIG_EXPORTED,
+    SERVICE_WRITE_CONFIG,
+    SENSOR_WIDGET_GAUGE,
+    SENSOR_WIDGET_LABEL,
+    SERVICE_WRITE_CONFIG_BULK,
+    STORAGE_VERSION,
+)
+from .entity_index import EntityWidgetIndex
+from .page_config import (
+    DISPLAY_PROFILES,
+    DeviceBudget,
+    DisplayProfile,
+    Page,
+    PageTypes,
+    ResourceEstimate,
+    Widget,
+    WidgetTypes,
+    join_fragments,
+    page_fragments,
+    update_rate_report,
+)
+from .registry import async_resolve_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_ICON = "mdi:lightbulb"
+
+# Registry changes that alter how a widget refers to its entity
+RENAME_CHANGES = {"entity_id", "name", "original_name"}
+
+# Entity domains shown by the bulk service, by widget kind
+BUTTON_DOMAINS = {Platform.LIGHT, Platform.SWITCH}
+SENSOR_DOMAINS = {Platform.SENSOR}
+
+SENSOR_WIDGET_TYPES = {
+    SENSOR_WIDGET_LABEL: WidgetTypes.SensorLabel,
+    SENSOR_WIDGET_GAUGE: WidgetTypes.SensorGauge,
+}
+
+# Options of sensor widgets, set for all sensors or per entity
+SENSOR_OPTIONS = (
+    ATTR_SENSOR_WIDGET,
+    ATTR_THROTTLE,
+    ATTR_DELTA,
+    ATTR_DEBOUNCE,
+    ATTR_MIN_VALUE,
+    ATTR_MAX_VALUE,
+)
+SENSOR_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SENSOR_WIDGET): vol.In(SENSOR_WIDGET_TYPES),
+        vol.Optional(ATTR_THROTTLE): vol.Coerce(float),
+        vol.Optional(ATTR_DELTA): vol.Coerce(float),
+        vol.Optional(ATTR_DEBOUNCE): vol.Coerce(float),
+        vol.Optional(ATTR_MIN_VALUE): vol.Coerce(int),
+        vol.Optional(ATTR_MAX_VALUE): vol.Coerce(int),
+    }
+)
+
 PLATFORMS = [Platform.SENSOR]
 
 
@@ -32,9 +127,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             translation_placeholders={"filename": filepath},
         )
 
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-
+    hass.data.setdefault(DOMAIN, {})
     if config_entry.entry_id not in hass.data[DOMAIN]:
         pages = LvglPagesCoordinator(hass, config_entry)
         # await pages.async_setup()
@@ -44,12 +137,110 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     #     config_entry, [Platform(config_entry.data[CONF_PLATFORM])]
     # )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_WRITE_CONFIG):
+        _async_register_services(hass)
+
+    if DATA_ENTITY_INDEX not in hass.data[DOMAIN]:
+        _async_setup_entity_index(hass)
+
+    await hass.data[DOMAIN][config_entry.entry_id].async_load()
+
+    config_entry.async_on_unload(config_entry.add_update_listener(update_listener))
+
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    # return await hass.config_entries.async_unload_platforms(
+    #     entry, [entry.data[CONF_PLATFORM]]
+    # )
+    hass.data[DOMAIN].pop(entry.entry_id, None)
+    hass.data[DOMAIN][DATA_ENTITY_INDEX].async_remove_entry(entry.entry_id)
+    if not _coordinators(hass):
+        hass.services.async_remove(DOMAIN, SERVICE_WRITE_CONFIG)
+        hass.services.async_remove(DOMAIN, SERVICE_WRITE_CONFIG_BULK)
+        hass.data[DOMAIN].pop(DATA_ENTITY_LISTENER)()
+        hass.data[DOMAIN].pop(DATA_ENTITY_INDEX)
+    return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored pages of a deleted config entry."""
+    await _pages_store(hass, entry).async_remove()
+
+
+def _pages_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict]:
+    """Return the store of the last exported pages of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+def _coordinators(hass: HomeAssistant) -> dict[str, LvglPagesCoordinator]:
+    """Return the coordinators of all loaded entries."""
+    return {
+        entry_id: coordinator
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if isinstance(coordinator, LvglPagesCoordinator)
+    }
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> LvglPagesCoordinator:
+    """Return the coordinator targeted by a service call."""
+    coordinators = _coordinators(hass)
+    entry_id = call.data.get(CONF_CONFIG_ENTRY_ID)
+    if entry_id is None and len(coordinators) == 1:
+        return next(iter(coordinators.values()))
+    if entry_id not in coordinators:
+        raise HomeAssistantError(
+            f"Service {call.service} needs a loaded {CONF_CONFIG_ENTRY_ID}"
+        )
+    return coordinators[entry_id]
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the services once, shared by all config entries."""
+
+    async def write_config(call: ServiceCall):
+        return await _get_coordinator(hass, call).service_config_compose(call)
+
+    async def write_config_bulk(call: ServiceCall):
+        return await _get_coordinator(hass, call).service_bulk_compose(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        service=SERVICE_WRITE_CONFIG_BULK,
+        service_func=write_config_bulk,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
+                vol.Optional(ATTR_AREA_ID, default=[]): cv.ensure_list,
+                vol.Optional(ATTR_LABEL_ID, default=[]): cv.ensure_list,
+                vol.Optional(CONF_DOMAIN, default=[]): cv.ensure_list,
+                vol.Optional(ATTR_SENSOR_WIDGET, default=SENSOR_WIDGET_LABEL): vol.In(
+                    SENSOR_WIDGET_TYPES
+                ),
+                vol.Optional(
+                    ATTR_THROTTLE, default=DEFAULT_SENSOR_THROTTLE
+                ): vol.Coerce(float),
+                vol.Optional(ATTR_DELTA): vol.Coerce(float),
+                vol.Optional(ATTR_DEBOUNCE): vol.Coerce(float),
+                vol.Optional(ATTR_MIN_VALUE): vol.Coerce(int),
+                vol.Optional(ATTR_MAX_VALUE): vol.Coerce(int),
+                vol.Optional(ATTR_SENSORS, default={}): {
+                    cv.entity_id: SENSOR_OPTIONS_SCHEMA
+                },
+            },
+        ),
+    )
+
     hass.services.async_register(
         DOMAIN,
-        service="write_config",
-        service_func=pages.service_config_compose,
+        service=SERVICE_WRITE_CONFIG,
+        service_func=write_config,
         schema=vol.Schema(
             {
+                vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
                 vol.Required(CONF_DEVICE_ID): cv.string,
                 vol.Required("page_name"): cv.string,
                 vol.Optional("widget_1"): cv.string,
@@ -58,17 +249,111 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         ),
     )
 
-    config_entry.async_on_unload(config_entry.add_update_listener(update_listener))
 
-    return True
+@callback
+def _async_setup_entity_index(hass: HomeAssistant) -> None:
+    """Index exported widgets by entity and follow entity registry changes."""
+    index = EntityWidgetIndex()
 
+    @callback
+    def _filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+        """Only handle removed or renamed entities shown by a widget."""
+        if event_data["action"] == "remove":
+            return event_data["entity_id"] in index
+        if event_data["action"] != "update":
+            return False
+        old_entity_id = event_data.get("old_entity_id", event_data["entity_id"])
+        return old_entity_id in index and bool(
+            RENAME_CHANGES.intersection(event_data["changes"])
+        )
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
-    # return await hass.config_entries.async_unload_platforms(
-    #     entry, [entry.data[CONF_PLATFORM]]
-    # )
-    return True
+    @callback
+    def _entity_registry_updated(event: Event[er.EventEntityRegistryUpdatedData]):
+        """Regenerate only the panels showing the changed entity."""
+        entity_id = event.data["entity_id"]
+        old_entity_id = event.data.get("old_entity_id", entity_id)
+        entry = None
+        texts = {}
+        if event.data["action"] == "update":
+            entry = er.async_get(hass).async_get(entity_id)
+            changes = event.data["changes"]
+            old_text = (
+                changes.get("name", entry.name)
+                or changes.get("original_name", entry.original_name)
+                or old_entity_id
+            )
+            # Texts showing the entity ID follow it, names follow the name
+            texts = {old_text: _entity_text(entry), old_entity_id: entry.entity_id}
+
+        coordinators = _coordinators(hass)
+        names = []
+        updates = []
+        for entry_id, pages in index.lookup(old_entity_id).copy().items():
+            if entry_id not in coordinators:
+                continue
+            _LOGGER.debug(
+                "Entity %s changed, regenerating pages %s of %s",
+                old_entity_id,
+                list(pages),
+                coordinators[entry_id].name,
+            )
+            names.append(coordinators[entry_id].name)
+            updates.append(
+                coordinators[entry_id].async_entity_changed(
+                    {widget for widgets in pages.values() for widget in widgets},
+                    entry,
+                    texts,
+                )
+            )
+
+        async def _async_regenerate() -> None:
+            """Export all panels, a failed panel does not hide the others."""
+            results = await asyncio.gather(*updates, return_exceptions=True)
+            exported = []
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.error("Could not regenerate pages of %s: %s", name, result)
+                else:
+                    exported.append(result)
+            _async_fire_exported(hass, exported)
+
+        hass.async_create_task(_async_regenerate())
+
+    hass.data[DOMAIN][DATA_ENTITY_INDEX] = index
+    hass.data[DOMAIN][DATA_ENTITY_LISTENER] = hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _entity_registry_updated,
+        event_filter=_filter,
+    )
+
+
+@callback
+def _async_fire_exported(hass: HomeAssistant, results: list[dict | None]) -> None:
+    """Fire a single event for the panels changed by an export."""
+    panels = [result for result in results if result is not None]
+    if panels:
+        hass.bus.async_fire(EVENT_CONFIG_EXPORTED, {"panels": panels})
+
+
+def _entity_text(entry: er.RegistryEntry) -> str:
+    """Return the text of a widget showing a registry entry."""
+    return entry.name or entry.original_name or entry.entity_id
+
+
+def _is_supported(entry: er.RegistryEntry) -> bool:
+    """Return if the bulk service has a widget for a registry entry.
+
+    Sensors are shown as numbers, so sensors without a unit or state class,
+    such as enum, timestamp or text sensors, are not supported.
+    """
+    if entry.domain in BUTTON_DOMAINS:
+        return True
+    if entry.domain in SENSOR_DOMAINS:
+        return bool(
+            entry.unit_of_measurement
+            or (entry.capabilities or {}).get(ATTR_STATE_CLASS)
+        )
+    return False
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -138,10 +423,20 @@ class LvglPagesCoordinator:
         """Initialize my coordinator."""
         self._hass = hass
         self._config = config_entry
+        self._export_lock = asyncio.Lock()
+        self._store = _pages_store(hass, config_entry)
+        self._pages: list[Page] = []
+        self._fingerprints: dict[str, str] = {}
+        self._update_rates: dict[str, float] = {}
+        self._estimates: dict[str, ResourceEstimate] = {}
 
     def as_dict(self):
         """For diagnostics serialization."""
         res = self.__dict__.copy()
+        res.pop("_hass")
+        res.pop("_export_lock")
+        res.pop("_store")
+        res["_pages"] = [page.definition() for page in self._pages]
         # for k, i in res.copy().items():
         #     if "_number_entity" in k:
         #         res[k] = {"id": i, "value": self.get_number_entity_value(i)}
@@ -162,48 +457,326 @@ class LvglPagesCoordinator:
             # model="Forecast",
         )
 
+    @property
+    def budget(self) -> DeviceBudget:
+        """Resource budget of the device, from the entry options."""
+        limits = {
+            key: int(self._config.options[key])
+            for key in (CONF_MAX_OBJECTS, CONF_MAX_HEAP_KB, CONF_MAX_FONT_KB)
+            if self._config.options.get(key) is not None
+        }
+        return DeviceBudget(**limits)
+
+    @property
+    def display_profiles(self) -> list[DisplayProfile]:
+        """Display profiles to export, from the entry options."""
+        return [
+            DISPLAY_PROFILES[name]
+            for name in self._config.options.get(CONF_DISPLAY_PROFILES, [])
+            if name in DISPLAY_PROFILES
+        ]
+
     def update(self):
         """Update the pages."""
         _LOGGER.debug("Updating pages")
 
-    def _try_compose_page(self) -> Page:
+    def _try_compose_page(self, page_options: dict) -> Page:
         _LOGGER.debug("Composing configuration")
-        page = Page(self._config.options["page_name"], page_type=PageTypes.Flex)
+        page = Page(page_options["page_name"], page_type=PageTypes.Flex)
         page.new_widget(
             widget_type=WidgetTypes.LocalLightButton,
             height=50,
-            text=self._config.options["widget_1"],
+            text=page_options["widget_1"],
             icon="mdi:lightbulb",
+            entity_id=page_options["widget_1"],
         )
         return page
 
-    def _export_config(self) -> bool:
-        """Export the configuration."""
-        page = self._try_compose_page()
-        if page is None:
-            return False
-
-        _LOGGER.debug("Exporting configuration")
+    def _compose_bulk_pages(
+        self,
+        resolved: dict[str, list[er.RegistryEntry]],
+        sensor_options: dict,
+        sensor_overrides: dict[str, dict] | None = None,
+    ) -> list[Page]:
+        """Compose one page per area from resolved registry entries.
+
+        Only supported entities get a widget, areas whose names slugify to
+        the same page id get a numbered suffix. Sensors get the widget and
+        filters of the sensor options, overridden per entity id.
+        """
+        _LOGGER.debug("Composing configuration for %s areas", len(resolved))
+        pages = []
+        page_ids = set()
+        for area_name, entries in sorted(resolved.items()):
+            supported = []
+            for entry in entries:
+                if _is_supported(entry):
+                    supported.append(entry)
+                else:
+                    _LOGGER.debug("Skipping unsupported entity %s", entry.entity_id)
+            if not supported:
+                continue
+
+            page_id = base_id = slugify(area_name)
+            suffix = 2
+            while page_id in page_ids:
+                page_id = f"{base_id}_{suffix}"
+                suffix += 1
+            page_ids.add(page_id)
+
+            page = Page(page_id, page_type=PageTypes.Flex)
+            for entry in supported:
+                widget = {
+                    "height": 50,
+                    "text": _entity_text(entry),
+                    "icon": entry.icon or entry.original_icon or DEFAULT_ICON,
+                    "entity_id": entry.entity_id,
+                }
+                if entry.domain in SENSOR_DOMAINS:
+                    options = {
+                        **sensor_options,
+                        **(sensor_overrides or {}).get(entry.entity_id, {}),
+                    }
+                    widget_type = SENSOR_WIDGET_TYPES[
+                        options.pop(ATTR_SENSOR_WIDGET, SENSOR_WIDGET_LABEL)
+                    ]
+                    if widget_type is not WidgetTypes.SensorGauge:
+                        options.pop(ATTR_MIN_VALUE, None)
+                        options.pop(ATTR_MAX_VALUE, None)
+                    page.new_widget(
+                        widget_type=widget_type,
+                        unit=entry.unit_of_measurement or "",
+                        **options,
+                        **widget,
+                    )
+                else:
+                    page.new_widget(widget_type=WidgetTypes.LocalLightButton, **widget)
+            pages.append(page)
+        return pages
+
+    def _check_budget(
+        self, estimates: dict[str, ResourceEstimate], profile: DisplayProfile | None
+    ) -> None:
+        """Compare the estimated resources with the device budget."""
+        total = sum(estimates.values(), ResourceEstimate())
+        profile_name = profile.name if profile else "default"
+        self._estimates[profile_name] = {**estimates, "total": total}
+        _LOGGER.debug("Estimated resources %s: %s", profile_name, total.as_dict())
+
+        problems = self.budget.exceeded(total)
+        if not problems:
+            return
+        message = (
+            f"Resource budget of {self.name} ({profile_name}) exceeded: "
+            f"{', '.join(problems)}"
+        )
+        if self._config.options.get(CONF_BUDGET_ACTION) == BUDGET_ACTION_REFUSE:
+            raise HomeAssistantError(message)
+        _LOGGER.warning(message)
+
+    def _remove_stale_outputs(
+        self, export_path: pathlib.Path, outputs: dict[pathlib.Path, tuple[str, str]]
+    ) -> list[str]:
+        """Remove the files of display profiles that are no longer exported.
+
+        These are the files without a profile once profiles are selected, and
+        the sub directories of deselected profiles. Return the removed files.
+        """
+        stale_paths = [export_path] + [
+            export_path.joinpath(name) for name in DISPLAY_PROFILES
+        ]
+        removed_files = []
+        for path in stale_paths:
+            if path in outputs:
+                continue
+            for filename in ("lvgl.yaml", "assets.yaml"):
+                file = path.joinpath(filename)
+                try:
+                    file.unlink()
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    raise HomeAssistantError("Could not remove stale config") from e
+                _LOGGER.debug("Removed stale configuration %s", file)
+                removed_files.append(str(file))
+            if path != export_path:
+                # Only succeeds if nothing else is left in the directory
+                with contextlib.suppress(OSError):
+                    path.rmdir()
+        return removed_files
+
+    def _export_config(self, pages: list[Page]) -> dict | None:
+        """Export the configuration, all pages in a single write.
+
+        The pages are composed once and projected to each display profile,
+        every profile is written to its own sub directory. Files with
+        unchanged content are not written again, outputs of profiles no
+        longer exported are removed. Return a summary of the changes, or None
+        if nothing changed.
+        """
         export_path = pathlib.Path(self._config.data[CONF_FILE_PATH]).joinpath(
             self._config.data["name"]
         )
-        try:
-            export_path.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise HomeAssistantError("Could not create config path") from e
-
-        try:
-            with open(export_path.joinpath("lvgl.yaml"), "w", encoding="utf8") as f:
-                f.write(dict_to_yaml_str(page.get_lvgl()))
-            with open(export_path.joinpath("assets.yaml"), "w", encoding="utf8") as f:
-                f.write(dict_to_yaml_str(page.get_assets()))
-        except OSError as e:
-            raise HomeAssistantError("Could not write config") from e
+        outputs: dict[pathlib.Path, tuple[str, str]] = {}
+        self._update_rates = update_rate_report(pages)
+        _LOGGER.debug("Worst case updates per second %s", self._update_rates)
+        self._estimates = {}
+        profiles = self.display_profiles or [None]
+        page_profiles = [page_fragments(page, profiles) for page in pages]
+        for index, profile in enumerate(profiles):
+            fragments = [fragments[index] for fragments in page_profiles]
+            self._check_budget(
+                {page.page_id: f.estimate for page, f in zip(pages, fragments)},
+                profile,
+            )
+            path = export_path.joinpath(profile.name) if profile else export_path
+            outputs[path] = join_fragments(fragments)
 
-        return True
+        _LOGGER.debug("Exporting configuration")
+        hashes: dict[str, str] = {}
+        changed_files: list[str] = []
+        lines_added = lines_removed = 0
+        for path, (lvgl, assets) in outputs.items():
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                raise HomeAssistantError("Could not create config path") from e
+
+            for filename, content in (("lvgl.yaml", lvgl), ("assets.yaml", assets)):
+                file = path.joinpath(filename)
+                hashes[str(file)] = hashlib.sha256(content.encode("utf8")).hexdigest()
+                try:
+                    previous = file.read_text(encoding="utf8")
+                except FileNotFoundError:
+                    previous = ""
+                except OSError as e:
+                    raise HomeAssistantError("Could not read config") from e
+                if previous == content:
+                    continue
+
+                try:
+                    with open(file, "w", encoding="utf8") as f:
+                        f.write(content)
+                except OSError as e:
+                    raise HomeAssistantError("Could not write config") from e
+                changed_files.append(str(file))
+                for line in difflib.unified_diff(
+                    previous.splitlines(), content.splitlines(), n=0, lineterm=""
+                ):
+                    if line.startswith("+") and not line.startswith("+++"):
+                        lines_added += 1
+                    elif line.startswith("-") and not line.startswith("---"):
+                        lines_removed += 1
+
+        removed_files = self._remove_stale_outputs(export_path, outputs)
+        fingerprints = {
+            page.page_id: fragments[0].fingerprint
+            for page, fragments in zip(pages, page_profiles)
+        }
+        previous_fingerprints, self._fingerprints = self._fingerprints, fingerprints
+        if not changed_files and not removed_files:
+            _LOGGER.debug("Configuration of %s is unchanged", self.name)
+            return None
+
+        return {
+            "name": self.name,
+            "entry_id": self._config.entry_id,
+            "paths": [str(path) for path in outputs],
+            "hashes": hashes,
+            "diff": {
+                "files": changed_files,
+                "files_removed": removed_files,
+                "lines_added": lines_added,
+                "lines_removed": lines_removed,
+                "pages_added": sorted(fingerprints.keys() - previous_fingerprints),
+                "pages_removed": sorted(previous_fingerprints.keys() - fingerprints),
+                "pages_changed": sorted(
+                    page_id
+                    for page_id in fingerprints.keys() & previous_fingerprints
+                    if fingerprints[page_id] != previous_fingerprints[page_id]
+                ),
+            },
+        }
+
+    async def async_load(self) -> None:
+        """Restore the pages of the last export and index their entities.
+
+        Their fingerprints are the base of the page changes reported by the
+        next export.
+        """
+        data = await self._store.async_load()
+        if data is None:
+            return
+        self._pages = [Page.from_definition(page) for page in data["pages"]]
+        self._fingerprints = {page.page_id: page.fingerprint() for page in self._pages}
+        self._hass.data[DOMAIN][DATA_ENTITY_INDEX].async_update_entry(
+            self._config.entry_id, self._pages
+        )
+
+    async def _async_export(self, pages: list[Page]) -> dict | None:
+        """Export pages, one export at a time."""
+        async with self._export_lock:
+            return await self._async_write(pages)
+
+    async def _async_write(self, pages: list[Page]) -> dict | None:
+        """Write and store pages, index the entities they show, export lock held."""
+        result = await self._hass.async_add_executor_job(self._export_config, pages)
+        self._pages = pages
+        await self._store.async_save({"pages": [page.definition() for page in pages]})
+        self._hass.data[DOMAIN][DATA_ENTITY_INDEX].async_update_entry(
+            self._config.entry_id, pages
+        )
+        return result
+
+    async def async_entity_changed(
+        self,
+        widgets: set[Widget],
+        entry: er.RegistryEntry | None,
+        texts: dict[str, str],
+    ) -> dict | None:
+        """Update the widgets of a renamed or removed entity and export again.
+
+        Widget texts equal to an old text of the entity are replaced by the
+        new one in texts. Only the pages holding the widgets change, the
+        others are served from the fragment cache. Changed pages are copies,
+        so a failed export keeps the current pages.
+        """
+        uids = {widget.uid for widget in widgets}
+        async with self._export_lock:
+            pages = []
+            for page in self._pages:
+                if any(w.uid in uids for w in page.widgets):
+                    page = Page.from_definition(page.definition())
+                    for widget in [w for w in page.widgets if w.uid in uids]:
+                        if entry is None:
+                            page.remove_widget(widget)
+                        else:
+                            widget.update_entity(entry.entity_id, texts)
+                pages.append(page)
+            return await self._async_write(pages)
 
     async def service_config_compose(self, call: ServiceCall):
         """Execute a service with an action command to Easee charging station."""
         _LOGGER.debug("Call compose config service %s", call.data)
-        self._config.options = call.data
-        return await self._hass.async_add_executor_job(self._export_config)
+        page = self._try_compose_page(call.data)
+        if page is None:
+            return
+        _async_fire_exported(self._hass, [await self._async_export([page])])
+
+    async def service_bulk_compose(self, call: ServiceCall):
+        """Write pages for all entities matching areas, labels and domains."""
+        _LOGGER.debug("Call bulk compose config service %s", call.data)
+        resolved = async_resolve_entities(
+            self._hass,
+            areas=call.data[ATTR_AREA_ID],
+            labels=call.data[ATTR_LABEL_ID],
+            domains=call.data[CONF_DOMAIN],
+        )
+        pages = self._compose_bulk_pages(
+            resolved,
+            {key: call.data[key] for key in SENSOR_OPTIONS if key in call.data},
+            call.data[ATTR_SENSORS],
+        )
+        if not pages:
+            raise HomeAssistantError("No supported entities match the given filters")
+        _async_fire_exported(self._hass, [await self._async_export(pages)])
@@ -17,12 +17,27 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_FILE_PATH, CONF_NAME
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
     TextSelector,
     TextSelectorConfig,
     TextSelectorType,
 )
 
-from .const import DOMAIN
+from .const import (
+    BUDGET_ACTION_REFUSE,
+    BUDGET_ACTION_WARN,
+    CONF_BUDGET_ACTION,
+    CONF_DISPLAY_PROFILES,
+    CONF_MAX_FONT_KB,
+    CONF_MAX_HEAP_KB,
+    CONF_MAX_OBJECTS,
+    DOMAIN,
+)
+from .page_config import DISPLAY_PROFILES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -116,6 +131,26 @@ class LvglPagesOptionsFlow(OptionsFlow):
                 vol.Required(CONF_FILE_PATH): TextSelector(
                     TextSelectorConfig(type=TextSelectorType.TEXT)
                 ),
+                vol.Optional(CONF_DISPLAY_PROFILES, default=[]): SelectSelector(
+                    SelectSelectorConfig(options=list(DISPLAY_PROFILES), multiple=True)
+                ),
+                vol.Optional(CONF_MAX_OBJECTS): NumberSelector(
+                    NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
+                ),
+                vol.Optional(CONF_MAX_HEAP_KB): NumberSelector(
+                    NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
+                ),
+                vol.Optional(CONF_MAX_FONT_KB): NumberSelector(
+                    NumberSelectorConfig(min=1, mode=NumberSelectorMode.BOX)
+                ),
+                vol.Optional(
+                    CONF_BUDGET_ACTION, default=BUDGET_ACTION_WARN
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[BUDGET_ACTION_WARN, BUDGET_ACTION_REFUSE],
+                        translation_key=CONF_BUDGET_ACTION,
+                    )
+                ),
             }
         )
 
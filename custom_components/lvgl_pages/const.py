@@ -1,3 +1,37 @@
 """Common constants for integration."""
 
 DOMAIN = "lvgl_pages"
+
+CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_HEAP_KB = "max_heap_kb"
+CONF_MAX_FONT_KB = "max_font_kb"
+CONF_BUDGET_ACTION = "budget_action"
+CONF_DISPLAY_PROFILES = "display_profiles"
+
+BUDGET_ACTION_WARN = "warn"
+BUDGET_ACTION_REFUSE = "refuse"
+
+CONF_CONFIG_ENTRY_ID = "config_entry_id"
+
+DATA_ENTITY_INDEX = "entity_index"
+DATA_ENTITY_LISTENER = "entity_listener"
+
+STORAGE_VERSION = 1
+
+EVENT_CONFIG_EXPORTED = f"{DOMAIN}_config_exported"
+
+SERVICE_WRITE_CONFIG = "write_config"
+SERVICE_WRITE_CONFIG_BULK = "write_config_bulk"
+
+ATTR_THROTTLE = "throttle"
+ATTR_DELTA = "delta"
+ATTR_DEBOUNCE = "debounce"
+ATTR_MIN_VALUE = "min_value"
+ATTR_MAX_VALUE = "max_value"
+ATTR_SENSOR_WIDGET = "sensor_widget"
+ATTR_SENSORS = "sensors"
+
+SENSOR_WIDGET_LABEL = "label"
+SENSOR_WIDGET_GAUGE = "gauge"
+
+DEFAULT_SENSOR_THROTTLE = 1.0
@@ -11,7 +11,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 # from . import LvglPages
-from .const import DOMAIN
+from .const import DATA_ENTITY_INDEX, DOMAIN
+from .page_config import FRAGMENT_CACHE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +25,8 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     diag_data = {
         "pages": hass.data[DOMAIN][config_entry.entry_id],
+        "fragment_cache": FRAGMENT_CACHE.as_dict(),
+        "entity_index": hass.data[DOMAIN][DATA_ENTITY_INDEX].as_dict(),
     }
 
     return diag_data
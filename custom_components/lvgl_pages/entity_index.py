@@ -0,0 +1,61 @@
+"""Reverse index from entities to the widgets showing them."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+
+from homeassistant.core import callback
+
+from .page_config import Page, Widget
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EntityWidgetIndex:
+    """Index of entity_id to config entry, page and widgets referencing it."""
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._index: dict[str, dict[str, dict[str, list[Widget]]]] = {}
+        self._entry_entities: dict[str, set[str]] = {}
+
+    def __contains__(self, entity_id: str) -> bool:
+        """Return if any widget references the entity."""
+        return entity_id in self._index
+
+    @callback
+    def async_update_entry(self, entry_id: str, pages: Iterable[Page]) -> None:
+        """Replace the references of a config entry with its exported pages."""
+        self.async_remove_entry(entry_id)
+        entities = self._entry_entities.setdefault(entry_id, set())
+        for page in pages:
+            for widget in page.widgets:
+                if not widget.entity_id:
+                    continue
+                entities.add(widget.entity_id)
+                self._index.setdefault(widget.entity_id, {}).setdefault(
+                    entry_id, {}
+                ).setdefault(page.page_id, []).append(widget)
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Remove all references of a config entry."""
+        for entity_id in self._entry_entities.pop(entry_id, set()):
+            references = self._index[entity_id]
+            references.pop(entry_id, None)
+            if not references:
+                del self._index[entity_id]
+
+    def lookup(self, entity_id: str) -> dict[str, dict[str, list[Widget]]]:
+        """Return the widgets referencing an entity, by config entry and page."""
+        return self._index.get(entity_id, {})
+
+    def as_dict(self) -> dict:
+        """For diagnostics serialization."""
+        return {
+            entity_id: {
+                entry_id: sorted(pages) for entry_id, pages in references.items()
+            }
+            for entity_id, references in self._index.items()
+        }
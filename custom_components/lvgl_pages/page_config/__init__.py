@@ -1,12 +1,30 @@
 """Page collection package."""
 
-import yaml
-
-from .pages import Page, PageTypes
-from .widgets import Widget, WidgetTypes
-
-
-def dict_to_yaml_str(config: dict) -> str:
-    """Convert a dictionary to a YAML string."""
-    yaml.Dumper.ignore_aliases = lambda *args: True
-    return yaml.dump(config, allow_unicode=True)
+from .pages import Page, PageTypes, merge_assets
+from .profiles import DISPLAY_PROFILES, DisplayProfile
+from .resources import (
+    DeviceBudget,
+    ResourceEstimate,
+    estimate_assets,
+    estimate_resources,
+)
+from .serialize import (
+    FRAGMENT_CACHE,
+    AssetsFragment,
+    FragmentCache,
+    LvglFragment,
+    PageFragment,
+    dict_to_yaml_str,
+    join_fragments,
+    page_fragment,
+    page_fragments,
+    update_rate_report,
+)
+from .widgets import (
+    Lambda,
+    SensorGaugeWidget,
+    SensorLabelWidget,
+    Widget,
+    WidgetTypes,
+    create_widget,
+)
@@ -1,14 +1,39 @@
 """Individual page properties."""
 
+from __future__ import annotations
+
 from abc import ABC
+from collections.abc import Iterable
 from enum import Enum
+import hashlib
+import json
 import logging
 
-from .widgets import Widget
+from .profiles import DisplayProfile
+from .widgets import Widget, WidgetTypes, create_widget
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def merge_assets(assets_list: Iterable[dict]) -> dict:
+    """Merge assets dictionaries, extending the lists of common keys."""
+    assets = {}
+    for a in assets_list:
+        for key, value in a.items():
+            if key in assets:
+                assets[key].extend(value)
+            else:
+                assets[key] = list(value)
+    return assets
+
+
+def _content_hash(content) -> str:
+    """Return a stable hash of JSON serializable content."""
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode("utf8")
+    ).hexdigest()
+
+
 class PageTypes(Enum):
     """Standard numeric identifiers for page types."""
 
@@ -32,30 +57,71 @@ class Page(ABC):
         ],
     }
 
-    _widgets: list[Widget] = []
-
     def __init__(self, page_id: str, page_type: PageTypes) -> None:
         """Initialize a page."""
         self.page_id = page_id
         self.page_type = page_type
+        self._widgets: list[Widget] = []
+
+    @classmethod
+    def from_definition(cls, definition: dict) -> Page:
+        """Create a page from its definition, keeping the widget UIDs."""
+        page = cls(definition["id"], page_type=PageTypes[definition["type"]])
+        for widget in definition["widgets"]:
+            widget = dict(widget)
+            page._widgets.append(
+                create_widget(widget_type=WidgetTypes[widget.pop("type")], **widget)
+            )
+        return page
 
     def new_widget(self, **kwargs) -> Widget:
-        """Add a widget to the page."""
-        widget = Widget(**kwargs)
+        """Add a widget to the page.
+
+        The widget UID is derived from the page, its position and content so
+        the same page always renders to the same configuration. The content is
+        the widget definition, so arguments left at their defaults or passed
+        explicitly give the same UID.
+        """
+        widget = create_widget(**kwargs)
+        content = {k: v for k, v in widget.definition().items() if k != "uid"}
+        widget.uid = _content_hash([self.page_id, len(self._widgets), content])[:8]
         self._widgets.append(widget)
         return widget
 
-    def get_lvgl(self) -> dict:
-        """Return the page as a dictionary."""
+    def remove_widget(self, widget: Widget) -> None:
+        """Remove a widget from the page."""
+        self._widgets.remove(widget)
+
+    def definition(self) -> dict:
+        """Return the logical content of the page."""
+        return {
+            "id": self.page_id,
+            "type": self.page_type.name,
+            "widgets": [w.definition() for w in self._widgets],
+        }
+
+    def fingerprint(self) -> str:
+        """Return a content hash of the page definition."""
+        return _content_hash(self.definition())
+
+    @property
+    def widgets(self) -> list[Widget]:
+        """Widgets on the page."""
+        return self._widgets
+
+    def get_lvgl(self, profile: DisplayProfile | None = None) -> dict:
+        """Return the page as a dictionary, projected to a display profile."""
         page = {
             "id": self.page_id,
             "width": "100%",
             "bg_color": "black",
             "bg_opa": "cover",
-            "pad_all": 5,
+            "pad_all": profile.pad_all if profile else 5,
             **self._SWIPE_NAVIGATION,
-            "widgets": [w.get_lvgl() for w in self._widgets],
+            "widgets": [w.get_lvgl(profile) for w in self._widgets],
         }
+        if profile:
+            page["height"] = profile.height
         if self.page_type == PageTypes.Flex:
             page["layout"] = {
                 "type": "flex",
@@ -66,7 +132,9 @@ class Page(ABC):
                 "type": "grid",
                 "grid_rows": ["fr(1)", "fr(1)"],
                 # "grid_columns": ["content", "content", "content", "content", "content", "content", "content"]
-                "grid_columns": ["content" for _ in range(7)],
+                "grid_columns": [
+                    "content" for _ in range(profile.grid_columns if profile else 7)
+                ],
                 "pad_column": 4,
                 "pad_row": 5,
             }
@@ -75,14 +143,10 @@ class Page(ABC):
 
         return page
 
+    def max_updates_per_second(self) -> float:
+        """Worst case number of redraws per second caused by state updates."""
+        return sum(w.max_updates_per_second() for w in self._widgets)
+
     def get_assets(self) -> dict:
         """Return the assets for the page."""
-        assets = {}
-        for widget in self._widgets:
-            a = widget.get_assets()
-            for key, value in a.items():
-                if key in assets:
-                    assets[key].extend(value)
-                else:
-                    assets[key] = value
-        return assets
+        return merge_assets(w.get_assets() for w in self._widgets)
@@ -0,0 +1,48 @@
+"""Display profiles, the resolution dependent part of a page."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DisplayProfile:
+    """Display properties a logical page is projected to."""
+
+    name: str
+    height: int
+    pad_all: int
+    grid_columns: int
+    text_font: str
+    icon_font: str
+
+
+DISPLAY_PROFILES = {
+    profile.name: profile
+    for profile in (
+        DisplayProfile(
+            name="320x240",
+            height=240,
+            pad_all=3,
+            grid_columns=4,
+            text_font="lv_font_montserrat_12",
+            icon_font="lv_font_montserrat_18",
+        ),
+        DisplayProfile(
+            name="480x480",
+            height=480,
+            pad_all=5,
+            grid_columns=5,
+            text_font="lv_font_montserrat_16",
+            icon_font="lv_font_montserrat_24",
+        ),
+        DisplayProfile(
+            name="800x480",
+            height=480,
+            pad_all=8,
+            grid_columns=7,
+            text_font="lv_font_montserrat_18",
+            icon_font="lv_font_montserrat_32",
+        ),
+    )
+}
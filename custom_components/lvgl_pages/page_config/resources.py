@@ -0,0 +1,223 @@
+"""Resource estimation for generated LVGL configurations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import re
+
+_LOGGER = logging.getLogger(__name__)
+
+# Approximate sizes on a 32-bit target, roughly following the LVGL v8 layout.
+OBJECT_BYTES = 84
+STYLE_ENTRY_BYTES = 8
+COMPONENT_BYTES = 64
+GLYPH_DSC_BYTES = 16
+
+DEFAULT_FONT = "lv_font_montserrat_14"
+DEFAULT_FONT_SIZE = 14
+
+# Characters printed by the printf conversions of label update formats
+NUMBER_GLYPHS = "0123456789.-"
+_CONVERSION = re.compile(r"%[-+ #0]*\d*(?:\.\d+)?([a-zA-Z%])")
+
+_STYLE_PREFIXES = (
+    "align",
+    "arc_",
+    "bg_",
+    "border_",
+    "height",
+    "line_",
+    "opa",
+    "outline_",
+    "pad_",
+    "radius",
+    "shadow_",
+    "text_",
+    "width",
+)
+
+
+def _is_style(key: str) -> bool:
+    """Return if a property key is stored as a style entry."""
+    return key.startswith(_STYLE_PREFIXES)
+
+
+def _font_size(font: str) -> int:
+    """Guess the pixel size of a font from its name."""
+    size = font.rsplit("_", 1)[-1]
+    return int(size) if size.isdigit() else DEFAULT_FONT_SIZE
+
+
+def _glyph_bytes(font: str) -> int:
+    """Approximate flash used by a single 4 bpp glyph of a font."""
+    size = _font_size(font)
+    return size * size // 2 + GLYPH_DSC_BYTES
+
+
+def _format_glyphs(text_format: str) -> set[str]:
+    """Return the characters a printf format can show at runtime."""
+    glyphs = set(_CONVERSION.sub("", text_format))
+    for conversion in _CONVERSION.findall(text_format):
+        glyphs.update("%" if conversion == "%" else NUMBER_GLYPHS)
+    return glyphs
+
+
+def _unwrap(item: dict) -> dict:
+    """Return the properties of a widget list item, typed or not."""
+    if len(item) == 1:
+        value = next(iter(item.values()))
+        if isinstance(value, dict):
+            return value
+    return item
+
+
+@dataclass
+class ResourceEstimate:
+    """Estimated resources needed by a configuration."""
+
+    objects: int = 0
+    styles: int = 0
+    components: int = 0
+    glyphs: dict[str, set[str]] = field(default_factory=dict)
+    # Font of each label and the glyphs set at runtime, by label id
+    label_fonts: dict[str, str] = field(default_factory=dict)
+    runtime_glyphs: dict[str, set[str]] = field(default_factory=dict)
+
+    def __add__(self, other: ResourceEstimate) -> ResourceEstimate:
+        """Combine two estimates, fonts are shared so glyphs are merged."""
+        glyphs = {font: set(chars) for font, chars in self.glyphs.items()}
+        for font, chars in other.glyphs.items():
+            glyphs.setdefault(font, set()).update(chars)
+        runtime_glyphs = {
+            label: set(chars) for label, chars in self.runtime_glyphs.items()
+        }
+        for label, chars in other.runtime_glyphs.items():
+            runtime_glyphs.setdefault(label, set()).update(chars)
+        return ResourceEstimate(
+            objects=self.objects + other.objects,
+            styles=self.styles + other.styles,
+            components=self.components + other.components,
+            glyphs=glyphs,
+            label_fonts={**self.label_fonts, **other.label_fonts},
+            runtime_glyphs=runtime_glyphs,
+        )
+
+    @property
+    def font_glyphs(self) -> dict[str, set[str]]:
+        """Glyphs of each font, static texts and texts set at runtime."""
+        glyphs = {font: set(chars) for font, chars in self.glyphs.items()}
+        for label, chars in self.runtime_glyphs.items():
+            font = self.label_fonts.get(label, DEFAULT_FONT)
+            glyphs.setdefault(font, set()).update(chars)
+        return glyphs
+
+    @property
+    def glyph_count(self) -> int:
+        """Number of distinct glyphs over all fonts."""
+        return sum(len(chars) for chars in self.font_glyphs.values())
+
+    @property
+    def heap_bytes(self) -> int:
+        """Approximate LVGL heap usage."""
+        return (
+            self.objects * OBJECT_BYTES
+            + self.styles * STYLE_ENTRY_BYTES
+            + self.components * COMPONENT_BYTES
+        )
+
+    @property
+    def font_bytes(self) -> int:
+        """Approximate flash usage of the glyphs in use."""
+        return sum(
+            len(chars) * _glyph_bytes(font) for font, chars in self.font_glyphs.items()
+        )
+
+    def as_dict(self) -> dict:
+        """For diagnostics serialization."""
+        return {
+            "objects": self.objects,
+            "styles": self.styles,
+            "components": self.components,
+            "glyphs": self.glyph_count,
+            "heap_bytes": self.heap_bytes,
+            "font_bytes": self.font_bytes,
+        }
+
+
+def _walk_lvgl(obj: dict, font: str, estimate: ResourceEstimate) -> None:
+    """Count an object and its children."""
+    estimate.objects += 1
+    estimate.styles += sum(1 for key in obj if _is_style(key))
+    font = obj.get("text_font", font)
+    if isinstance(obj.get("text"), str):
+        estimate.glyphs.setdefault(font, set()).update(obj["text"])
+        if "id" in obj:
+            estimate.label_fonts[obj["id"]] = font
+    for child in obj.get("widgets", []):
+        _walk_lvgl(_unwrap(child), font, estimate)
+
+
+def _walk_assets(node, estimate: ResourceEstimate) -> None:
+    """Count style entries and label texts set at runtime by update actions."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key.startswith("lvgl.") and key.endswith(".update"):
+                estimate.styles += sum(1 for k in value if _is_style(k))
+                text = value.get("text")
+                if isinstance(text, dict) and "format" in text:
+                    estimate.runtime_glyphs.setdefault(value["id"], set()).update(
+                        _format_glyphs(text["format"])
+                    )
+            else:
+                _walk_assets(value, estimate)
+    elif isinstance(node, list):
+        for item in node:
+            _walk_assets(item, estimate)
+
+
+def estimate_assets(assets: dict) -> ResourceEstimate:
+    """Estimate the resources of the assets of a page."""
+    estimate = ResourceEstimate()
+    estimate.components += sum(len(items) for items in assets.values())
+    _walk_assets(assets, estimate)
+    return estimate
+
+
+def estimate_resources(lvgl: dict, assets: dict | None = None) -> ResourceEstimate:
+    """Estimate the resources of a page from its composed LVGL and assets."""
+    estimate = ResourceEstimate()
+    _walk_lvgl(lvgl, DEFAULT_FONT, estimate)
+    if assets:
+        estimate += estimate_assets(assets)
+    return estimate
+
+
+@dataclass
+class DeviceBudget:
+    """Resource limits of a display device, None means unlimited."""
+
+    max_objects: int | None = None
+    max_heap_kb: int | None = None
+    max_font_kb: int | None = None
+
+    def exceeded(self, estimate: ResourceEstimate) -> list[str]:
+        """Return a description of each limit the estimate exceeds."""
+        problems = []
+        if self.max_objects is not None and estimate.objects > self.max_objects:
+            problems.append(f"objects {estimate.objects} > {self.max_objects}")
+        if (
+            self.max_heap_kb is not None
+            and estimate.heap_bytes > self.max_heap_kb * 1024
+        ):
+            problems.append(
+                f"heap {estimate.heap_bytes / 1024:.1f} kB > {self.max_heap_kb} kB"
+            )
+        if (
+            self.max_font_kb is not None
+            and estimate.font_bytes > self.max_font_kb * 1024
+        ):
+            problems.append(
+                f"fonts {estimate.font_bytes / 1024:.1f} kB > {self.max_font_kb} kB"
+            )
+        return problems
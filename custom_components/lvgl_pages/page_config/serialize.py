@@ -0,0 +1,183 @@
+"""YAML serialization and a process-wide cache of page fragments."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import logging
+import threading
+from typing import NamedTuple
+
+import yaml
+
+from .pages import Page
+from .profiles import DisplayProfile
+from .resources import ResourceEstimate, estimate_assets, estimate_resources
+from .widgets import Lambda
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAGMENT_CACHE_SIZE = 256
+
+yaml.add_representer(
+    Lambda, lambda dumper, data: dumper.represent_scalar("!lambda", str(data))
+)
+
+
+def dict_to_yaml_str(config: dict) -> str:
+    """Convert a dictionary to a YAML string."""
+    yaml.Dumper.ignore_aliases = lambda *args: True
+    return yaml.dump(config, allow_unicode=True)
+
+
+class LvglFragment(NamedTuple):
+    """Serialized LVGL of a page projected to a display profile."""
+
+    lvgl: str
+    estimate: ResourceEstimate
+
+
+class AssetsFragment(NamedTuple):
+    """Serialized asset lists of a page, the same for all display profiles."""
+
+    assets: dict[str, str]
+    estimate: ResourceEstimate
+
+
+class PageFragment(NamedTuple):
+    """Serialized output of a single page."""
+
+    fingerprint: str
+    lvgl: str
+    assets: dict[str, str]
+    estimate: ResourceEstimate
+
+
+class FragmentCache:
+    """Size-bounded LRU cache of serialized fragments, shared by all panels."""
+
+    def __init__(self, maxsize: int = FRAGMENT_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._fragments: OrderedDict[str, LvglFragment | AssetsFragment] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, key: str, factory: Callable[[], LvglFragment | AssetsFragment]
+    ) -> LvglFragment | AssetsFragment:
+        """Return the fragment of a key, creating it on a miss."""
+        with self._lock:
+            if key in self._fragments:
+                self.hits += 1
+                self._fragments.move_to_end(key)
+                return self._fragments[key]
+            self.misses += 1
+
+        fragment = factory()
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self._maxsize:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def clear(self) -> None:
+        """Remove all fragments and reset the counters."""
+        with self._lock:
+            self._fragments.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def as_dict(self) -> dict:
+        """For diagnostics serialization."""
+        return {
+            "size": len(self._fragments),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+FRAGMENT_CACHE = FragmentCache()
+
+
+def _serialize_lvgl(page: Page, profile: DisplayProfile | None) -> LvglFragment:
+    """Compose a page for a display profile and serialize its LVGL."""
+    _LOGGER.debug("Serializing LVGL of page %s", page.page_id)
+    lvgl = page.get_lvgl(profile)
+    return LvglFragment(
+        lvgl=dict_to_yaml_str([lvgl]), estimate=estimate_resources(lvgl)
+    )
+
+
+def _serialize_assets(page: Page) -> AssetsFragment:
+    """Serialize each asset list of a page."""
+    _LOGGER.debug("Serializing assets of page %s", page.page_id)
+    assets = page.get_assets()
+    return AssetsFragment(
+        assets={key: dict_to_yaml_str(value) for key, value in assets.items()},
+        estimate=estimate_assets(assets),
+    )
+
+
+def page_fragments(
+    page: Page, profiles: Iterable[DisplayProfile | None]
+) -> list[PageFragment]:
+    """Return the serialized page for each display profile.
+
+    The page is hashed and its assets are serialized once, only the LVGL is
+    projected to each profile. Fragments are reused for pages with identical
+    content.
+    """
+    fingerprint = page.fingerprint()
+    assets = FRAGMENT_CACHE.get(
+        f"{fingerprint}/assets", lambda: _serialize_assets(page)
+    )
+    fragments = []
+    for profile in profiles:
+        key = f"{fingerprint}@{profile.name}" if profile else fingerprint
+        lvgl = FRAGMENT_CACHE.get(key, lambda: _serialize_lvgl(page, profile))
+        fragments.append(
+            PageFragment(
+                fingerprint=fingerprint,
+                lvgl=lvgl.lvgl,
+                assets=assets.assets,
+                estimate=lvgl.estimate + assets.estimate,
+            )
+        )
+    return fragments
+
+
+def page_fragment(page: Page, profile: DisplayProfile | None = None) -> PageFragment:
+    """Return the serialized page for a single display profile."""
+    return page_fragments(page, [profile])[0]
+
+
+def update_rate_report(pages: Iterable[Page]) -> dict[str, float]:
+    """Return the worst case redraws per second of each page."""
+    return {page.page_id: page.max_updates_per_second() for page in pages}
+
+
+def join_fragments(fragments: Iterable[PageFragment]) -> tuple[str, str]:
+    """Join page fragments into the LVGL and assets documents.
+
+    Top level sequences are not indented by the dumper, so the result is the
+    same as dumping the combined dictionaries at once.
+    """
+    fragments = list(fragments)
+    if fragments:
+        lvgl = "pages:\n" + "".join(f.lvgl for f in fragments)
+    else:
+        lvgl = dict_to_yaml_str({"pages": []})
+
+    keys = sorted({key for f in fragments for key in f.assets})
+    if keys:
+        assets = "".join(
+            f"{key}:\n" + "".join(f.assets[key] for f in fragments if key in f.assets)
+            for key in keys
+        )
+    else:
+        assets = dict_to_yaml_str({})
+    return lvgl, assets
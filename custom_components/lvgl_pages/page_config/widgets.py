@@ -1,10 +1,15 @@
 """Individual widgets properties."""
 
+from __future__ import annotations
+
 from abc import ABC
 from enum import Enum
 import logging
+import math
 import uuid
 
+from .profiles import DisplayProfile
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -13,6 +18,12 @@ class WidgetTypes(Enum):
 
     LocalLightButton = 1
     RemoteLightButton = 2
+    SensorLabel = 3
+    SensorGauge = 4
+
+
+class Lambda(str):
+    """ESPHome lambda, written with the !lambda tag."""
 
 
 class Widget(ABC):
@@ -20,29 +31,70 @@ class Widget(ABC):
 
     _config = {}
 
-    def __init__(self, widget_type: WidgetTypes, height, text, icon) -> None:
+    def __init__(
+        self, widget_type: WidgetTypes, height, text, icon, entity_id=None, uid=None
+    ) -> None:
         """Initialize a widget."""
-        self._uid = str(uuid.uuid4())[:8]
+        self._uid = uid or str(uuid.uuid4())[:8]
         # _LOGGER.info(f"Widget UID: {self._uid}")
         self._widget_type = widget_type
         self._height = height
         self._text = text
         self._icon = icon
+        self.entity_id = entity_id
         self._icon_font = "lv_font_montserrat_24"
 
+    @property
+    def uid(self) -> str:
+        """Unique identifier of the widget."""
+        return self._uid
+
+    @uid.setter
+    def uid(self, uid: str) -> None:
+        """Set the unique identifier of the widget."""
+        self._uid = uid
+
+    def definition(self) -> dict:
+        """Return the content of the widget, the UID is part of its output."""
+        return {
+            "type": self._widget_type.name,
+            "uid": self._uid,
+            "height": self._height,
+            "text": self._text,
+            "icon": self._icon,
+            "entity_id": self.entity_id,
+        }
+
+    def update_entity(self, entity_id: str, texts: dict[str, str]) -> None:
+        """Point the widget to a renamed entity, keeping its UID.
+
+        The text is replaced only if it is one of the old texts of the entity
+        in texts, so widgets keep showing the entity ID, name or a custom text.
+        """
+        self.entity_id = entity_id
+        self._text = texts.get(self._text, self._text)
+
+    def max_updates_per_second(self) -> float:
+        """Worst case number of redraws per second caused by state updates.
+
+        Buttons are only redrawn by user interaction.
+        """
+        return 0.0
+
     def add_config(self, config: dict):
         """Add a configuration to the widget."""
         self._config.update(config)
 
-    def get_lvgl(self) -> dict:
+    def get_lvgl(self, profile: DisplayProfile | None = None) -> dict:
         """Return the configuration of the widget."""
+        icon_font = profile.icon_font if profile else self._icon_font
         widget = {
             "height": self._height,
             "id": f"button_{self._uid}",
             "widgets": [
                 {
                     "label": {
-                        "text_font": self._icon_font,
+                        "text_font": icon_font,
                         "align": "top_left",
                         "id": f"icon_{self._uid}",
                         "text": self._icon,
@@ -58,6 +110,8 @@ class Widget(ABC):
             ],
             "on_short_click": {"light.toggle": f"local_light_{self._uid}"},
         }
+        if profile:
+            widget["widgets"][1]["label"]["text_font"] = profile.text_font
         return widget
         # height: ${height}
         # id: button_${uid}
@@ -158,3 +212,179 @@ class Widget(ABC):
         #             id: label_${uid}
         #             text_color: $label_off_color
         return assets
+
+
+def _duration(seconds: float) -> str:
+    """Format a duration in seconds as an ESPHome time period."""
+    return f"{round(seconds * 1000)}ms"
+
+
+class SensorLabelWidget(Widget):
+    """Sensor value shown in a label, with rate limiting filters."""
+
+    def __init__(
+        self,
+        widget_type: WidgetTypes,
+        height,
+        text,
+        icon,
+        entity_id=None,
+        uid=None,
+        unit: str = "",
+        accuracy: int = 1,
+        throttle: float | None = None,
+        delta: float | None = None,
+        debounce: float | None = None,
+    ) -> None:
+        """Initialize a sensor widget, throttle and debounce are in seconds."""
+        super().__init__(widget_type, height, text, icon, entity_id, uid)
+        self._unit = unit
+        self._accuracy = accuracy
+        self._throttle = throttle
+        self._delta = delta
+        self._debounce = debounce
+
+    def definition(self) -> dict:
+        """Return the content of the widget, the UID is part of its output."""
+        return {
+            **super().definition(),
+            "unit": self._unit,
+            "accuracy": self._accuracy,
+            "throttle": self._throttle,
+            "delta": self._delta,
+            "debounce": self._debounce,
+        }
+
+    def max_updates_per_second(self) -> float:
+        """Worst case number of redraws per second caused by state updates.
+
+        A delta filter depends on the values so only time based filters bound
+        the rate, without them every state change redraws.
+        """
+        periods = [p for p in (self._throttle, self._debounce) if p]
+        if not periods:
+            return math.inf
+        return 1 / max(periods)
+
+    def _label(
+        self, label_id: str, align: str, text: str, profile: DisplayProfile | None
+    ) -> dict:
+        """Return a label in the text font of the profile."""
+        label = {"align": align, "id": label_id, "text": text}
+        if profile:
+            label["text_font"] = profile.text_font
+        return {"label": label}
+
+    def _value_label(self, profile: DisplayProfile | None) -> dict:
+        """Return the label showing the value."""
+        return self._label(f"value_{self._uid}", "bottom_left", "--", profile)
+
+    def get_lvgl(self, profile: DisplayProfile | None = None) -> dict:
+        """Return the configuration of the widget."""
+        return {
+            "obj": {
+                "height": self._height,
+                "id": f"sensor_{self._uid}",
+                "widgets": [
+                    self._label(f"label_{self._uid}", "top_left", self._text, profile),
+                    self._value_label(profile),
+                ],
+            }
+        }
+
+    def _filters(self) -> list[dict]:
+        """Return the sensor filters limiting the update rate."""
+        filters = []
+        if self._delta is not None:
+            filters.append({"delta": self._delta})
+        if self._debounce:
+            filters.append({"debounce": _duration(self._debounce)})
+        if self._throttle:
+            filters.append({"throttle": _duration(self._throttle)})
+        return filters
+
+    def _on_value(self) -> list[dict]:
+        """Return the actions updating the display on a new value."""
+        return [
+            {
+                "lvgl.label.update": {
+                    "id": f"value_{self._uid}",
+                    "text": {
+                        "format": f"%.{self._accuracy}f"
+                        + self._unit.replace("%", "%%"),
+                        "args": ["x"],
+                    },
+                }
+            }
+        ]
+
+    def get_assets(self) -> dict:
+        """Return the assets for the widget."""
+        sensor = {
+            "platform": "homeassistant",
+            "id": f"sensor_value_{self._uid}",
+            "entity_id": self.entity_id,
+            "internal": True,
+            "on_value": {"then": self._on_value()},
+        }
+        if filters := self._filters():
+            sensor["filters"] = filters
+        return {"sensor": [sensor]}
+
+
+class SensorGaugeWidget(SensorLabelWidget):
+    """Sensor value shown as an arc gauge, with rate limiting filters."""
+
+    def __init__(
+        self, *args, min_value: int = 0, max_value: int = 100, **kwargs
+    ) -> None:
+        """Initialize a gauge widget."""
+        super().__init__(*args, **kwargs)
+        self._min_value = min_value
+        self._max_value = max_value
+
+    def definition(self) -> dict:
+        """Return the content of the widget, the UID is part of its output."""
+        return {
+            **super().definition(),
+            "min_value": self._min_value,
+            "max_value": self._max_value,
+        }
+
+    def get_lvgl(self, profile: DisplayProfile | None = None) -> dict:
+        """Return the configuration of the widget."""
+        return {
+            "arc": {
+                "height": self._height,
+                "width": self._height,
+                "id": f"gauge_{self._uid}",
+                "min_value": self._min_value,
+                "max_value": self._max_value,
+                "value": self._min_value,
+                "adjustable": False,
+                "widgets": [self._value_label(profile)],
+            }
+        }
+
+    def _on_value(self) -> list[dict]:
+        """Return the actions updating the display on a new value."""
+        return [
+            {
+                "lvgl.arc.update": {
+                    "id": f"gauge_{self._uid}",
+                    "value": Lambda("return x;"),
+                }
+            },
+            *super()._on_value(),
+        ]
+
+
+_WIDGET_CLASSES: dict[WidgetTypes, type[Widget]] = {
+    WidgetTypes.SensorLabel: SensorLabelWidget,
+    WidgetTypes.SensorGauge: SensorGaugeWidget,
+}
+
+
+def create_widget(widget_type: WidgetTypes, **kwargs) -> Widget:
+    """Create a widget of the class matching the widget type."""
+    return _WIDGET_CLASSES.get(widget_type, Widget)(widget_type=widget_type, **kwargs)
@@ -0,0 +1,62 @@
+"""Batched entity selection from the Home Assistant registries."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+NO_AREA = "other"
+
+
+@callback
+def async_resolve_entities(
+    hass: HomeAssistant,
+    areas: Iterable[str] = (),
+    labels: Iterable[str] = (),
+    domains: Iterable[str] = (),
+) -> dict[str, list[er.RegistryEntry]]:
+    """Return the matching entities grouped by area name.
+
+    The device and area registries are indexed once up front so the entity
+    registry is walked in a single pass, whatever the number of entities.
+    An empty filter matches everything.
+    """
+    areas, labels, domains = set(areas), set(labels), set(domains)
+
+    area_names = {area.id: area.name for area in ar.async_get(hass).async_list_areas()}
+    device_index = {
+        device.id: (device.area_id, device.labels)
+        for device in dr.async_get(hass).devices.values()
+    }
+
+    resolved: dict[str, list[er.RegistryEntry]] = {}
+    for entry in er.async_get(hass).entities.values():
+        if entry.disabled_by is not None or entry.hidden_by is not None:
+            continue
+        if domains and entry.domain not in domains:
+            continue
+
+        device_area, device_labels = device_index.get(entry.device_id, (None, ()))
+        area_id = entry.area_id or device_area
+        if areas and area_id not in areas:
+            continue
+        if labels and not labels & (entry.labels | set(device_labels)):
+            continue
+
+        resolved.setdefault(area_names.get(area_id, NO_AREA), []).append(entry)
+
+    _LOGGER.debug(
+        "Resolved %s entities in %s areas",
+        sum(len(entries) for entries in resolved.values()),
+        len(resolved),
+    )
+    return resolved
@@ -35,15 +35,7 @@ class LvglPages:
 
     def get_all_assets(self) -> str:
         """Return the assets."""
-        output_data = {}
-        for page in self._pages:
-            a = page.get_assets()
-            for key, value in a.items():
-                if key in output_data:
-                    output_data[key].extend(value)
-                else:
-                    output_data[key] = value
-            # output_data.update(page.get_assets())
+        output_data = page_config.merge_assets(p.get_assets() for p in self._pages)
         return page_config.dict_to_yaml_str(output_data)
 
 
@@ -1,9 +1,44 @@
 """Fixtures for testing."""
 
+from custom_components.lvgl_pages.const import DOMAIN
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_FILE_PATH, CONF_NAME
+from homeassistant.setup import async_setup_component
 
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations."""
     return
+
+
+@pytest.fixture
+def setup_entries(hass, tmp_path):
+    """Return a function setting up one panel entry per name.
+
+    All panels export to tmp_path. The integration is set up once, so the
+    function is called once per test.
+    """
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+
+    async def _async_setup(
+        names: list[str], options: dict | None = None
+    ) -> list[MockConfigEntry]:
+        entries = []
+        for name in names:
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={CONF_NAME: name, CONF_FILE_PATH: str(tmp_path)},
+                options=options or {},
+                version=0,
+                minor_version=1,
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        return entries
+
+    return _async_setup
@@ -0,0 +1,127 @@
+"""Entity index tests."""
+
+from custom_components.lvgl_pages.const import (
+    DATA_ENTITY_INDEX,
+    DOMAIN,
+    SERVICE_WRITE_CONFIG,
+    SERVICE_WRITE_CONFIG_BULK,
+)
+import yaml
+
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.helpers import entity_registry as er
+
+
+async def test_regenerate_on_registry_change(hass, tmp_path, setup_entries):
+    """Test renamed and removed entities regenerate the panels showing them."""
+    (entry,) = await setup_entries(["panel"])
+
+    ent_reg = er.async_get(hass)
+    switch = ent_reg.async_get_or_create("switch", "test", "kitchen")
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_WRITE_CONFIG,
+        {
+            CONF_DEVICE_ID: "device",
+            "page_name": "main_page",
+            "widget_1": switch.entity_id,
+        },
+        blocking=True,
+    )
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    assert list(index.lookup(switch.entity_id)[entry.entry_id]) == ["main_page"]
+
+    ent_reg.async_update_entity(switch.entity_id, new_entity_id="switch.renamed")
+    await hass.async_block_till_done()
+
+    assert switch.entity_id not in index
+    assert "switch.renamed" in index
+    lvgl = tmp_path.joinpath("panel", "lvgl.yaml").read_text(encoding="utf8")
+    assert "switch.renamed" in lvgl
+
+    ent_reg.async_remove("switch.renamed")
+    await hass.async_block_till_done()
+
+    assert "switch.renamed" not in index
+    lvgl = tmp_path.joinpath("panel", "lvgl.yaml").read_text(encoding="utf8")
+    assert "switch.renamed" not in lvgl
+
+
+async def test_index_restored_on_reload(hass, tmp_path, setup_entries):
+    """Test a reloaded entry still follows entities of its last export."""
+    (entry,) = await setup_entries(["panel"])
+
+    ent_reg = er.async_get(hass)
+    switch = ent_reg.async_get_or_create("switch", "test", "kitchen")
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_WRITE_CONFIG,
+        {
+            CONF_DEVICE_ID: "device",
+            "page_name": "main_page",
+            "widget_1": switch.entity_id,
+        },
+        blocking=True,
+    )
+    uid = hass.data[DOMAIN][entry.entry_id]._pages[0].widgets[0].uid
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    assert list(index.lookup(switch.entity_id)[entry.entry_id]) == ["main_page"]
+
+    ent_reg.async_update_entity(switch.entity_id, new_entity_id="switch.renamed")
+    await hass.async_block_till_done()
+
+    lvgl = tmp_path.joinpath("panel", "lvgl.yaml").read_text(encoding="utf8")
+    assert "switch.renamed" in lvgl
+    assert f"button_{uid}" in lvgl
+
+
+def _label_texts(tmp_path) -> list[str]:
+    """Return the texts of the button labels of the exported panel."""
+    lvgl = yaml.safe_load(tmp_path.joinpath("panel", "lvgl.yaml").read_text())
+    return [
+        button["widgets"][1]["label"]["text"]
+        for page in lvgl["pages"]
+        for button in page["widgets"]
+    ]
+
+
+async def test_rename_keeps_text_scheme(hass, tmp_path, setup_entries):
+    """Test widget texts follow what they showed, the entity ID or name."""
+    await setup_entries(["panel"])
+    ent_reg = er.async_get(hass)
+    switch = ent_reg.async_get_or_create("switch", "test", "kitchen")
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_WRITE_CONFIG,
+        {
+            CONF_DEVICE_ID: "device",
+            "page_name": "main_page",
+            "widget_1": switch.entity_id,
+        },
+        blocking=True,
+    )
+
+    ent_reg.async_update_entity(switch.entity_id, name="Kitchen lamp")
+    await hass.async_block_till_done()
+    assert _label_texts(tmp_path) == ["switch.test_kitchen"]
+
+    ent_reg.async_update_entity(switch.entity_id, new_entity_id="switch.lamp")
+    await hass.async_block_till_done()
+    assert _label_texts(tmp_path) == ["switch.lamp"]
+
+    light = ent_reg.async_get_or_create("light", "test", "hall", original_name="Hall")
+    await hass.services.async_call(
+        DOMAIN, SERVICE_WRITE_CONFIG_BULK, {"domain": ["light"]}, blocking=True
+    )
+    assert _label_texts(tmp_path) == ["Hall"]
+
+    ent_reg.async_update_entity(light.entity_id, name="Hallway")
+    await hass.async_block_till_done()
+    assert _label_texts(tmp_path) == ["Hallway"]
+
+    ent_reg.async_update_entity(light.entity_id, new_entity_id="light.hallway")
+    await hass.async_block_till_done()
+    assert _label_texts(tmp_path) == ["Hallway"]
@@ -0,0 +1,170 @@
+"""Export event tests."""
+
+from custom_components.lvgl_pages.const import (
+    CONF_CONFIG_ENTRY_ID,
+    CONF_DISPLAY_PROFILES,
+    DATA_ENTITY_INDEX,
+    DOMAIN,
+    EVENT_CONFIG_EXPORTED,
+    SERVICE_WRITE_CONFIG,
+)
+
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import HomeAssistantError, callback
+from homeassistant.helpers import entity_registry as er
+
+
+class BuildConsumer:
+    """Stand-in for a firmware build server, rebuilding changed panels."""
+
+    def __init__(self) -> None:
+        """Initialize the consumer."""
+        self.events = []
+        self.rebuilt = []
+
+    @callback
+    def async_handle(self, event) -> None:
+        """Rebuild the panels reported by an event."""
+        self.events.append(event.data)
+        self.rebuilt.extend(panel["name"] for panel in event.data["panels"])
+
+
+async def _async_write(hass, entry, page_name: str, entity_id: str) -> None:
+    """Call write_config for an entry."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_WRITE_CONFIG,
+        {
+            CONF_CONFIG_ENTRY_ID: entry.entry_id,
+            CONF_DEVICE_ID: "device",
+            "page_name": page_name,
+            "widget_1": entity_id,
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+
+async def test_changed_panels_reported(hass, tmp_path, setup_entries):
+    """Test only changed panels are reported, batches in a single event."""
+    entries = await setup_entries(["kitchen", "hall"])
+
+    consumer = BuildConsumer()
+    hass.bus.async_listen(EVENT_CONFIG_EXPORTED, consumer.async_handle)
+
+    switch = er.async_get(hass).async_get_or_create("switch", "test", "lamp")
+    kitchen, hall = entries
+    await _async_write(hass, kitchen, "main_page", switch.entity_id)
+    await _async_write(hass, hall, "main_page", switch.entity_id)
+    assert consumer.rebuilt == ["kitchen", "hall"]
+
+    panel = consumer.events[0]["panels"][0]
+    lvgl_path = str(tmp_path.joinpath("kitchen", "lvgl.yaml"))
+    assert panel["paths"] == [str(tmp_path.joinpath("kitchen"))]
+    assert lvgl_path in panel["hashes"]
+    assert lvgl_path in panel["diff"]["files"]
+    assert panel["diff"]["pages_added"] == ["main_page"]
+    assert panel["diff"]["lines_removed"] == 0
+
+    # Writing the same content again is not reported
+    await _async_write(hass, kitchen, "main_page", switch.entity_id)
+    assert consumer.rebuilt == ["kitchen", "hall"]
+
+    await _async_write(hass, hall, "main_page", "switch.other")
+    assert consumer.rebuilt == ["kitchen", "hall", "hall"]
+    assert consumer.events[-1]["panels"][0]["diff"]["pages_changed"] == ["main_page"]
+
+    # A rename touching both panels is published as one event
+    await _async_write(hass, hall, "main_page", switch.entity_id)
+    events = len(consumer.events)
+    er.async_get(hass).async_update_entity(
+        switch.entity_id, new_entity_id="switch.renamed"
+    )
+    await hass.async_block_till_done()
+    assert len(consumer.events) == events + 1
+    assert sorted(p["name"] for p in consumer.events[-1]["panels"]) == [
+        "hall",
+        "kitchen",
+    ]
+
+
+async def test_failed_panel_export(hass, caplog, setup_entries):
+    """Test a failed panel keeps its pages and the others are still reported."""
+    entries = await setup_entries(["kitchen", "hall"])
+
+    switch = er.async_get(hass).async_get_or_create("switch", "test", "lamp")
+    kitchen, hall = entries
+    await _async_write(hass, kitchen, "main_page", switch.entity_id)
+    await _async_write(hass, hall, "main_page", switch.entity_id)
+
+    consumer = BuildConsumer()
+    hass.bus.async_listen(EVENT_CONFIG_EXPORTED, consumer.async_handle)
+
+    def _fail(pages):
+        raise HomeAssistantError("Could not write config")
+
+    hall_pages = hass.data[DOMAIN][hall.entry_id]
+    hall_pages._export_config = _fail
+    er.async_get(hass).async_update_entity(
+        switch.entity_id, new_entity_id="switch.renamed"
+    )
+    await hass.async_block_till_done()
+
+    assert consumer.rebuilt == ["kitchen"]
+    assert "Could not regenerate pages of hall" in caplog.text
+    assert hall_pages._pages[0].widgets[0].entity_id == switch.entity_id
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    assert list(index.lookup(switch.entity_id)) == [hall.entry_id]
+    assert list(index.lookup("switch.renamed")) == [kitchen.entry_id]
+
+
+async def test_page_changes_after_reload(hass, setup_entries):
+    """Test page changes are reported against the export before a reload."""
+    (entry,) = await setup_entries(["kitchen"])
+
+    consumer = BuildConsumer()
+    hass.bus.async_listen(EVENT_CONFIG_EXPORTED, consumer.async_handle)
+    await _async_write(hass, entry, "main_page", "switch.lamp")
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    await _async_write(hass, entry, "main_page", "switch.other")
+    assert len(consumer.events) == 2
+    diff = consumer.events[-1]["panels"][0]["diff"]
+    assert diff["pages_added"] == []
+    assert diff["pages_changed"] == ["main_page"]
+
+
+async def test_stale_profile_outputs_removed(hass, tmp_path, setup_entries):
+    """Test outputs of display profiles no longer exported are removed."""
+    (entry,) = await setup_entries(["panel"])
+    consumer = BuildConsumer()
+    hass.bus.async_listen(EVENT_CONFIG_EXPORTED, consumer.async_handle)
+    panel = tmp_path.joinpath("panel")
+
+    async def _async_write_profiles(profiles: list[str]) -> dict:
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_DISPLAY_PROFILES: profiles}
+        )
+        await hass.async_block_till_done()
+        await _async_write(hass, entry, "main_page", "switch.lamp")
+        return consumer.events[-1]["panels"][0]
+
+    await _async_write(hass, entry, "main_page", "switch.lamp")
+    assert panel.joinpath("lvgl.yaml").is_file()
+
+    result = await _async_write_profiles(["320x240", "480x480"])
+    assert sorted(p.name for p in panel.iterdir()) == ["320x240", "480x480"]
+    assert result["diff"]["files_removed"] == [
+        str(panel.joinpath("lvgl.yaml")),
+        str(panel.joinpath("assets.yaml")),
+    ]
+
+    result = await _async_write_profiles(["480x480"])
+    assert [p.name for p in panel.iterdir()] == ["480x480"]
+    assert result["diff"]["files"] == []
+    assert result["diff"]["files_removed"] == [
+        str(panel.joinpath("320x240", "lvgl.yaml")),
+        str(panel.joinpath("320x240", "assets.yaml")),
+    ]
+    assert result["paths"] == [str(panel.joinpath("480x480"))]
@@ -0,0 +1,185 @@
+"""Load tests, many config entries and bursts of service calls."""
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+import gc
+import io
+import os
+import threading
+import time
+import tracemalloc
+
+import coverage
+from custom_components.lvgl_pages.const import (
+    CONF_CONFIG_ENTRY_ID,
+    DOMAIN,
+    SERVICE_WRITE_CONFIG,
+)
+import pytest
+
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.runner import MAX_EXECUTOR_WORKERS
+
+NUM_ENTRIES = 25
+NUM_BURSTS = 4
+
+# Pass/fail thresholds
+MAX_LOOP_BLOCK = 0.02  # seconds
+MAX_SETUP_TIME = 2.0  # seconds
+MAX_EXECUTOR_LATENCY = 2.0  # seconds
+MAX_MEMORY_GROWTH = 4 * 1024 * 1024  # bytes
+FILES_PER_EXPORT = 2
+
+
+class LoadStats:
+    """Collected measurements of a load run."""
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.loop_block = 0.0
+        self.slowest_callback = ""
+        self.setup_time = 0.0
+        self.executor_latency: list[float] = []
+        self.file_writes = 0
+        self.loop_file_io: list[str] = []
+
+
+@contextmanager
+def _timed_phase(hass, stats: LoadStats) -> Iterator[None]:
+    """Measure the wall-clock time of each callback run by the event loop.
+
+    Sleeps and disk or lock waits on the loop are counted. Asyncio debug mode,
+    coverage tracing, garbage collection and executor thread start-up would
+    be counted too, so they are kept out of the timed phase.
+    """
+    run = asyncio.Handle._run
+
+    def timed_run(handle):
+        start = time.perf_counter()
+        run(handle)
+        duration = time.perf_counter() - start
+        if duration > stats.loop_block:
+            stats.loop_block = duration
+            stats.slowest_callback = repr(handle)
+
+    debug = hass.loop.get_debug()
+    hass.loop.set_debug(False)
+    cov = coverage.Coverage.current()
+    if cov:
+        cov.stop()
+    gc.collect()
+    gc.disable()
+    asyncio.Handle._run = timed_run
+    try:
+        yield
+    finally:
+        asyncio.Handle._run = run
+        gc.enable()
+        if cov:
+            cov.start()
+        hass.loop.set_debug(debug)
+
+
+@pytest.fixture
+def stats(hass, tmp_path, monkeypatch) -> LoadStats:
+    """Instrument executor jobs and file access."""
+    stats = LoadStats()
+
+    add_executor_job = hass.async_add_executor_job
+
+    def timed_executor_job(target, *args):
+        queued = time.monotonic()
+
+        def run():
+            stats.executor_latency.append(time.monotonic() - queued)
+            return target(*args)
+
+        return add_executor_job(run)
+
+    monkeypatch.setattr(hass, "async_add_executor_job", timed_executor_job)
+
+    loop_thread = threading.get_ident()
+    io_open = io.open
+    os_mkdir = os.mkdir
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        if str(file).startswith(str(tmp_path)):
+            if "w" in mode:
+                stats.file_writes += 1
+            if threading.get_ident() == loop_thread:
+                stats.loop_file_io.append(f"open {file}")
+        return io_open(file, mode, *args, **kwargs)
+
+    def counting_mkdir(path, *args, **kwargs):
+        if threading.get_ident() == loop_thread:
+            stats.loop_file_io.append(f"mkdir {path}")
+        return os_mkdir(path, *args, **kwargs)
+
+    # pathlib reads and writes through io.open
+    monkeypatch.setattr(io, "open", counting_open)
+    monkeypatch.setattr("builtins.open", counting_open)
+    monkeypatch.setattr(os, "mkdir", counting_mkdir)
+    return stats
+
+
+async def _async_burst(hass, entries, page_name: str) -> None:
+    """Call write_config for all entries at once."""
+    await asyncio.gather(
+        *(
+            hass.services.async_call(
+                DOMAIN,
+                SERVICE_WRITE_CONFIG,
+                {
+                    CONF_CONFIG_ENTRY_ID: entry.entry_id,
+                    CONF_DEVICE_ID: "device",
+                    "page_name": page_name,
+                    "widget_1": "switch.test",
+                },
+                blocking=True,
+            )
+            for entry in entries
+        )
+    )
+
+
+async def test_service_bursts(hass, tmp_path, stats, setup_entries):
+    """Set up many entries and fire concurrent write_config bursts."""
+    # Start all executor threads up front, a callback starting one waits for it.
+    # The jobs block until all are queued, so no thread is reused.
+    queued = threading.Event()
+    jobs = [
+        hass.async_add_executor_job(queued.wait) for _ in range(MAX_EXECUTOR_WORKERS)
+    ]
+    queued.set()
+    await asyncio.gather(*jobs)
+    with _timed_phase(hass, stats):
+        start = time.perf_counter()
+        entries = await setup_entries([f"panel_{i}" for i in range(NUM_ENTRIES)])
+        stats.setup_time = time.perf_counter() - start
+        for burst in range(NUM_BURSTS):
+            await _async_burst(hass, entries, f"page_{burst}")
+    # Start a new step of this task, the timed one ends here
+    await asyncio.sleep(0)
+
+    # Setup and exports again, leaks show up as growth
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    await asyncio.gather(
+        *(hass.config_entries.async_reload(entry.entry_id) for entry in entries)
+    )
+    for burst in range(NUM_BURSTS):
+        await _async_burst(hass, entries, f"other_page_{burst}")
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert growth < MAX_MEMORY_GROWTH
+    assert stats.loop_block < MAX_LOOP_BLOCK, stats.slowest_callback
+    assert stats.setup_time < MAX_SETUP_TIME
+    assert max(stats.executor_latency) < MAX_EXECUTOR_LATENCY
+    # Every burst changes the page, so each call writes all files
+    assert stats.file_writes == 2 * NUM_ENTRIES * NUM_BURSTS * FILES_PER_EXPORT
+    assert stats.loop_file_io == []
+    for i in range(NUM_ENTRIES):
+        assert tmp_path.joinpath(f"panel_{i}", "lvgl.yaml").is_file()
@@ -1,5 +1,6 @@
 """Pages tests."""
 
+import math
 from unittest import mock
 
 from custom_components.lvgl_pages import LvglPagesCoordinator
@@ -12,10 +13,27 @@ from custom_components.lvgl_pages import LvglPagesCoordinator
 #     mock_platform,
 # )
 from custom_components.lvgl_pages.const import DOMAIN
+from custom_components.lvgl_pages.page_config import (
+    DISPLAY_PROFILES,
+    FRAGMENT_CACHE,
+    DeviceBudget,
+    Page,
+    PageTypes,
+    WidgetTypes,
+    dict_to_yaml_str,
+    estimate_resources,
+    join_fragments,
+    merge_assets,
+    page_fragment,
+    page_fragments,
+    update_rate_report,
+)
+from custom_components.lvgl_pages.registry import NO_AREA, async_resolve_entities
 import pytest
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_FILE_PATH, CONF_NAME
+from homeassistant.helpers import area_registry as ar, entity_registry as er
 
 # from homeassistant.components import sensor
 # from homeassistant.core import HomeAssistant
@@ -63,3 +81,289 @@ async def test_pages_init(hass):
     pages = LvglPagesCoordinator(hass, CONF_ENTRY)
 
     assert pages.name == NAME
+
+
+def test_estimate_resources():
+    """Test the resource estimation of a composed page."""
+    page = Page("main_page", page_type=PageTypes.Flex)
+    page.new_widget(
+        widget_type=WidgetTypes.LocalLightButton,
+        height=50,
+        text="Toggle",
+        icon="mdi:lightbulb",
+    )
+
+    estimate = estimate_resources(page.get_lvgl(), page.get_assets())
+    assert estimate.objects == 4
+    assert estimate.components == 1
+    assert estimate.glyph_count == len(set("Toggle")) + len(set("mdi:lightbulb"))
+
+    total = estimate + estimate
+    assert total.objects == 8
+    assert total.glyph_count == estimate.glyph_count
+    assert total.font_bytes == estimate.font_bytes
+
+
+def test_estimate_sensor_glyphs():
+    """Test the glyphs of sensor values shown at runtime are estimated."""
+    page = Page("climate_page", page_type=PageTypes.Flex)
+    page.new_widget(
+        widget_type=WidgetTypes.SensorLabel,
+        height=50,
+        text="Power",
+        icon=None,
+        entity_id="sensor.power",
+        unit=" kW",
+    )
+    profile = DISPLAY_PROFILES["480x480"]
+
+    fragment = page_fragment(page, profile)
+    glyphs = set("Power") | set("--") | set("0123456789.-") | set(" kW")
+    assert fragment.estimate.font_glyphs == {profile.text_font: glyphs}
+    assert fragment.estimate.glyph_count == len(glyphs)
+
+
+def test_budget_exceeded():
+    """Test the device budget limits."""
+    page = Page("main_page", page_type=PageTypes.Flex)
+    for _ in range(3):
+        page.new_widget(
+            widget_type=WidgetTypes.LocalLightButton,
+            height=50,
+            text="Toggle",
+            icon="mdi:lightbulb",
+        )
+    estimate = estimate_resources(page.get_lvgl(), page.get_assets())
+
+    assert DeviceBudget().exceeded(estimate) == []
+    assert DeviceBudget(max_objects=100, max_heap_kb=64).exceeded(estimate) == []
+    problems = DeviceBudget(max_objects=5, max_font_kb=1).exceeded(estimate)
+    assert len(problems) == 2
+
+
+async def test_resolve_entities(hass):
+    """Test batched entity resolution grouped by area."""
+    kitchen = ar.async_get(hass).async_create("Kitchen")
+    ent_reg = er.async_get(hass)
+    for i in range(3):
+        entry = ent_reg.async_get_or_create("light", "test", f"light_{i}")
+        ent_reg.async_update_entity(entry.entity_id, area_id=kitchen.id)
+    ent_reg.async_get_or_create("light", "test", "light_other")
+    ent_reg.async_get_or_create("switch", "test", "switch_other")
+
+    resolved = async_resolve_entities(hass, domains=["light"])
+    assert len(resolved["Kitchen"]) == 3
+    assert len(resolved[NO_AREA]) == 1
+
+    resolved = async_resolve_entities(hass, areas=[kitchen.id])
+    assert list(resolved) == ["Kitchen"]
+
+    assert async_resolve_entities(hass, labels=["missing"]) == {}
+
+
+async def test_compose_bulk_pages(hass):
+    """Test bulk pages skip unsupported entities and get unique ids."""
+    area_reg = ar.async_get(hass)
+    ent_reg = er.async_get(hass)
+    for i, area_name in enumerate(("Other", "Living Room", "Living-room")):
+        area = area_reg.async_create(area_name)
+        entry = ent_reg.async_get_or_create("light", "test", f"light_{i}")
+        ent_reg.async_update_entity(entry.entity_id, area_id=area.id)
+    ent_reg.async_get_or_create("light", "test", "light_no_area")
+    ent_reg.async_get_or_create(
+        "sensor", "test", "sensor_no_area", unit_of_measurement="W"
+    )
+    ent_reg.async_get_or_create(
+        "sensor", "test", "counter_no_area", capabilities={"state_class": "total"}
+    )
+    ent_reg.async_get_or_create(
+        "sensor", "test", "enum_no_area", capabilities={"options": ["on", "off"]}
+    )
+    ent_reg.async_get_or_create("sensor", "test", "timestamp_no_area")
+    ent_reg.async_get_or_create("automation", "test", "automation_no_area")
+
+    pages = LvglPagesCoordinator(hass, CONF_ENTRY)._compose_bulk_pages(
+        async_resolve_entities(hass), {}
+    )
+
+    assert [page.page_id for page in pages] == [
+        "living_room",
+        "living_room_2",
+        "other",
+        "other_2",
+    ]
+    assert [w.entity_id for w in pages[3].widgets] == [
+        "light.test_light_no_area",
+        "sensor.test_sensor_no_area",
+        "sensor.test_counter_no_area",
+    ]
+
+
+def _light_page(page_id: str, *texts: str) -> Page:
+    """Create a page with a light button for each text."""
+    page = Page(page_id, page_type=PageTypes.Flex)
+    for text in texts:
+        page.new_widget(
+            widget_type=WidgetTypes.LocalLightButton,
+            height=50,
+            text=text,
+            icon="mdi:lightbulb",
+        )
+    return page
+
+
+def test_fragment_cache():
+    """Test identical pages are serialized once and reused."""
+    FRAGMENT_CACHE.clear()
+    first = page_fragment(_light_page("main_page", "Kitchen", "Hall"))
+    second = page_fragment(_light_page("main_page", "Kitchen", "Hall"))
+    other = page_fragment(_light_page("main_page", "Kitchen"))
+
+    assert second == first
+    assert second.lvgl is first.lvgl
+    assert other.fingerprint != first.fingerprint
+    # One LVGL and one assets fragment per distinct page
+    assert FRAGMENT_CACHE.as_dict()["hits"] == 2
+    assert FRAGMENT_CACHE.as_dict()["misses"] == 4
+
+
+def test_fragment_cache_uid():
+    """Test widget UIDs follow the content, not the spelling of arguments."""
+    pages = []
+    for filters in ({}, {"throttle": None, "delta": None, "debounce": None}):
+        page = Page("main_page", page_type=PageTypes.Flex)
+        page.new_widget(
+            widget_type=WidgetTypes.SensorLabel,
+            height=50,
+            text="Temperature",
+            icon=None,
+            entity_id="sensor.temperature",
+            **filters,
+        )
+        pages.append(page)
+    FRAGMENT_CACHE.clear()
+    first, second = (page_fragment(page) for page in pages)
+
+    assert pages[0].widgets[0].uid == pages[1].widgets[0].uid
+    assert second.lvgl is first.lvgl
+    assert FRAGMENT_CACHE.as_dict()["hits"] == 2
+
+    # Pages only differing in widget UIDs get their own fragments
+    definition = pages[1].definition()
+    definition["widgets"][0]["uid"] = "other"
+    other = page_fragment(Page.from_definition(definition))
+    assert other.fingerprint != first.fingerprint
+    assert "value_other" in other.lvgl
+
+
+def test_join_fragments():
+    """Test joined fragments equal the combined dump byte-for-byte."""
+    pages = [_light_page("main_page", "Kitchen", "Hall"), _light_page("info", "x")]
+    lvgl, assets = join_fragments(page_fragment(page) for page in pages)
+
+    assert lvgl == dict_to_yaml_str({"pages": [p.get_lvgl() for p in pages]})
+    assert assets == dict_to_yaml_str(merge_assets(p.get_assets() for p in pages))
+
+
+def test_display_profiles():
+    """Test one page model projected to several display profiles."""
+    page = Page("main_page", page_type=PageTypes.Grid)
+    page.new_widget(
+        widget_type=WidgetTypes.LocalLightButton,
+        height=50,
+        text="Toggle",
+        icon="mdi:lightbulb",
+    )
+
+    default = page.get_lvgl()
+    assert "height" not in default
+    assert len(default["layout"]["grid_columns"]) == 7
+
+    for profile in DISPLAY_PROFILES.values():
+        lvgl = page.get_lvgl(profile)
+        assert lvgl["height"] == profile.height
+        assert lvgl["pad_all"] == profile.pad_all
+        assert len(lvgl["layout"]["grid_columns"]) == profile.grid_columns
+        icon, label = lvgl["widgets"][0]["widgets"]
+        assert icon["label"]["text_font"] == profile.icon_font
+        assert label["label"]["text_font"] == profile.text_font
+        assert lvgl["widgets"][0]["id"] == default["widgets"][0]["id"]
+
+    FRAGMENT_CACHE.clear()
+    small, large = page_fragments(
+        page, [DISPLAY_PROFILES["320x240"], DISPLAY_PROFILES["800x480"]]
+    )
+    assert small.lvgl != large.lvgl
+    assert small.assets is large.assets
+    assert small.fingerprint == large.fingerprint == page.fingerprint()
+    # Assets are serialized once, the LVGL once per profile
+    assert FRAGMENT_CACHE.as_dict()["misses"] == 3
+
+
+def test_sensor_widgets():
+    """Test sensor widgets are rate limited by their filters."""
+    page = Page("power_page", page_type=PageTypes.Flex)
+    page.new_widget(
+        widget_type=WidgetTypes.SensorGauge,
+        height=100,
+        text="Power",
+        icon=None,
+        entity_id="sensor.power",
+        throttle=2,
+        delta=5,
+        max_value=3000,
+    )
+    page.new_widget(
+        widget_type=WidgetTypes.SensorLabel,
+        height=50,
+        text="Temperature",
+        icon=None,
+        entity_id="sensor.temperature",
+        throttle=1,
+        debounce=0.5,
+    )
+
+    gauge, label = page.get_assets()["sensor"]
+    assert gauge["entity_id"] == "sensor.power"
+    assert gauge["internal"] is True
+    assert gauge["filters"] == [{"delta": 5}, {"throttle": "2000ms"}]
+    assert label["filters"] == [{"debounce": "500ms"}, {"throttle": "1000ms"}]
+    assert "!lambda" in dict_to_yaml_str(page.get_assets())
+
+    assert update_rate_report([page]) == {"power_page": 1.5}
+
+    restored = Page.from_definition(page.definition())
+    assert restored.definition() == page.definition()
+    assert restored.get_assets() == page.get_assets()
+
+    page.new_widget(
+        widget_type=WidgetTypes.SensorLabel,
+        height=50,
+        text="Unfiltered",
+        icon=None,
+        entity_id="sensor.noisy",
+    )
+    assert math.isinf(page.max_updates_per_second())
+
+
+def test_sensor_label():
+    """Test sensor labels follow the profile font and escape the unit."""
+    page = Page("climate_page", page_type=PageTypes.Flex)
+    page.new_widget(
+        widget_type=WidgetTypes.SensorLabel,
+        height=50,
+        text="Humidity",
+        icon=None,
+        entity_id="sensor.humidity",
+        unit="%",
+        accuracy=0,
+    )
+    profile = DISPLAY_PROFILES["480x480"]
+
+    name, value = page.get_lvgl(profile)["widgets"][0]["obj"]["widgets"]
+    assert name["label"]["text_font"] == profile.text_font
+    assert value["label"]["text_font"] == profile.text_font
+
+    (sensor,) = page.get_assets()["sensor"]
+    update = sensor["on_value"]["then"][0]["lvgl.label.update"]
+    assert update["text"]["format"] == "%.0f%%"
@@ -0,0 +1,154 @@
+"""Service call tests."""
+
+import builtins
+import logging
+from unittest import mock
+
+from custom_components.lvgl_pages.const import (
+    BUDGET_ACTION_REFUSE,
+    BUDGET_ACTION_WARN,
+    CONF_BUDGET_ACTION,
+    CONF_CONFIG_ENTRY_ID,
+    CONF_MAX_OBJECTS,
+    DOMAIN,
+    SERVICE_WRITE_CONFIG,
+    SERVICE_WRITE_CONFIG_BULK,
+)
+import pytest
+import yaml
+
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import HomeAssistantError
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+
+NUM_AREAS = 20
+ENTITIES_PER_AREA = 15
+
+
+async def _async_write(hass) -> None:
+    """Call write_config for the only entry."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_WRITE_CONFIG,
+        {
+            CONF_DEVICE_ID: "device",
+            "page_name": "main_page",
+            "widget_1": "switch.lamp",
+        },
+        blocking=True,
+    )
+
+
+async def test_budget_refuse(hass, tmp_path, setup_entries):
+    """Test an export over budget is refused without writing files."""
+    await setup_entries(
+        ["panel"],
+        options={CONF_MAX_OBJECTS: 1, CONF_BUDGET_ACTION: BUDGET_ACTION_REFUSE},
+    )
+
+    with pytest.raises(HomeAssistantError, match="Resource budget of panel"):
+        await _async_write(hass)
+    assert not tmp_path.joinpath("panel").exists()
+
+
+async def test_budget_warn(hass, tmp_path, caplog, setup_entries):
+    """Test an export over budget is written with a warning."""
+    await setup_entries(
+        ["panel"],
+        options={CONF_MAX_OBJECTS: 1, CONF_BUDGET_ACTION: BUDGET_ACTION_WARN},
+    )
+
+    with caplog.at_level(logging.WARNING):
+        await _async_write(hass)
+    assert "Resource budget of panel (default) exceeded: objects" in caplog.text
+    assert tmp_path.joinpath("panel", "lvgl.yaml").is_file()
+    assert tmp_path.joinpath("panel", "assets.yaml").is_file()
+
+
+async def test_bulk_compose(hass, tmp_path, setup_entries):
+    """Test a bulk call for hundreds of entities writes each file once."""
+    area_reg = ar.async_get(hass)
+    ent_reg = er.async_get(hass)
+    for i in range(NUM_AREAS):
+        area = area_reg.async_create(f"Area {i}")
+        for j in range(ENTITIES_PER_AREA):
+            domain, options = [
+                ("light", {}),
+                ("switch", {}),
+                ("sensor", {"unit_of_measurement": "W"}),
+            ][j % 3]
+            entry = ent_reg.async_get_or_create(domain, "test", f"{i}_{j}", **options)
+            ent_reg.async_update_entity(entry.entity_id, area_id=area.id)
+    _, entry = await setup_entries(["panel_a", "panel_b"])
+
+    written = []
+    real_open = builtins.open
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        if "w" in mode:
+            written.append(file)
+        return real_open(file, mode, *args, **kwargs)
+
+    with mock.patch("custom_components.lvgl_pages.open", counting_open, create=True):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_WRITE_CONFIG_BULK,
+            {CONF_CONFIG_ENTRY_ID: entry.entry_id},
+            blocking=True,
+        )
+
+    assert written == [
+        tmp_path.joinpath("panel_b", "lvgl.yaml"),
+        tmp_path.joinpath("panel_b", "assets.yaml"),
+    ]
+    assert not tmp_path.joinpath("panel_a").exists()
+    lvgl = tmp_path.joinpath("panel_b", "lvgl.yaml").read_text(encoding="utf8")
+    assets = tmp_path.joinpath("panel_b", "assets.yaml").read_text(encoding="utf8")
+    for i in range(NUM_AREAS):
+        assert f"area_{i}" in lvgl
+    for entity in ent_reg.entities.values():
+        assert entity.entity_id in assets
+
+
+async def test_bulk_compose_no_match(hass, tmp_path, setup_entries):
+    """Test a bulk call without supported entities fails without writing."""
+    er.async_get(hass).async_get_or_create("automation", "test", "automation")
+    await setup_entries(["panel"])
+
+    with pytest.raises(HomeAssistantError, match="No supported entities"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_WRITE_CONFIG_BULK, {}, blocking=True
+        )
+    assert not tmp_path.joinpath("panel").exists()
+
+
+async def test_bulk_compose_sensor_options(hass, tmp_path, setup_entries):
+    """Test a bulk call sets sensor widgets and filters per entity."""
+    ent_reg = er.async_get(hass)
+    for name in ("power", "energy"):
+        ent_reg.async_get_or_create(
+            "sensor", "test", name, suggested_object_id=name, unit_of_measurement="W"
+        )
+    await setup_entries(["panel"])
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_WRITE_CONFIG_BULK,
+        {
+            "delta": 1,
+            "max_value": 3000,
+            "sensors": {
+                "sensor.power": {"sensor_widget": "gauge", "throttle": 5},
+            },
+        },
+        blocking=True,
+    )
+
+    lvgl = yaml.safe_load(tmp_path.joinpath("panel", "lvgl.yaml").read_text())
+    assets = tmp_path.joinpath("panel", "assets.yaml").read_text()
+    power, energy = lvgl["pages"][0]["widgets"]
+    assert power["arc"]["max_value"] == 3000
+    assert "obj" in energy
+    assert assets.count("delta: 1.0") == 2
+    assert assets.count("throttle: 5000ms") == 1
+    assert assets.count("throttle: 1000ms") == 1